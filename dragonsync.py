@@ -273,6 +273,8 @@ def zmq_to_cot(
             cot_messenger.close()
         if drone_manager:
             drone_manager.close()
+        if lattice_sink is not None:
+            lattice_sink.close()
         logger.info("Cleaned up ZMQ resources")
         sys.exit(0)
 
@@ -716,6 +718,12 @@ if __name__ == "__main__":
     parser.add_argument("--lattice-source-name", type=str, help="Provenance source name (or env LATTICE_SOURCE_NAME)")
     parser.add_argument("--lattice-drone-rate", type=float, help="Drone publish rate to Lattice (Hz)")
     parser.add_argument("--lattice-wd-rate", type=float, help="WarDragon publish rate to Lattice (Hz)")
+    parser.add_argument("--lattice-drone-burst", type=int, help="Drone updates allowed back-to-back before the Lattice drone rate applies")
+    parser.add_argument("--lattice-pilot-rate", type=float, help="Pilot publish rate to Lattice (Hz)")
+    parser.add_argument("--lattice-home-rate", type=float, help="Home point publish rate to Lattice (Hz)")
+    parser.add_argument("--lattice-heartbeat", type=float, help="Re-publish unchanged Lattice entities at least this often (s); 0 = just before expiry")
+    parser.add_argument("--lattice-raw-publish", action="store_true", help="Publish to Lattice as pre-serialized REST JSON instead of SDK models (requires base URL/endpoint)")
+    parser.add_argument("--lattice-compress", action="store_true", help="Gzip raw Lattice request bodies (with --lattice-raw-publish)")
     args = parser.parse_args()
 
     # Load config file if provided
@@ -791,6 +799,12 @@ if __name__ == "__main__":
         ),
         "lattice_drone_rate": args.lattice_drone_rate if args.lattice_drone_rate is not None else get_float(config_values.get("lattice_drone_rate", 1.0)),
         "lattice_wd_rate": args.lattice_wd_rate if args.lattice_wd_rate is not None else get_float(config_values.get("lattice_wd_rate", 0.2)),
+        "lattice_drone_burst": args.lattice_drone_burst if args.lattice_drone_burst is not None else get_int(config_values.get("lattice_drone_burst", 3), 3),
+        "lattice_pilot_rate": args.lattice_pilot_rate if args.lattice_pilot_rate is not None else get_float(config_values.get("lattice_pilot_rate", 1.0)),
+        "lattice_home_rate": args.lattice_home_rate if args.lattice_home_rate is not None else get_float(config_values.get("lattice_home_rate", 1.0)),
+        "lattice_heartbeat": args.lattice_heartbeat if args.lattice_heartbeat is not None else get_float(config_values.get("lattice_heartbeat", 0.0)),
+        "lattice_raw_publish": args.lattice_raw_publish or get_bool(config_values.get("lattice_raw_publish"), False),
+        "lattice_compress": args.lattice_compress or get_bool(config_values.get("lattice_compress"), False),
     }
 
     if config["mqtt_enabled"] and mqtt is None:
@@ -835,13 +849,21 @@ if __name__ == "__main__":
                     env_tok_len = len(token)
                     sb_tok_len = len(sb)
                     logger.debug(f"Lattice base_url resolved: {base_url!r}, env_token_len={env_tok_len}, sandbox_token_len={sb_tok_len}")
+                    heartbeat = config.get("lattice_heartbeat") or 0.0
+                    policies = {kind: {"heartbeat": heartbeat} for kind in ("system", "drone", "pilot", "home")} if heartbeat > 0 else None
                     lattice_sink = LatticeSink(
                         token=token,
                         base_url=base_url or None,
                         drone_hz=config.get("lattice_drone_rate", 1.0),
                         wardragon_hz=config.get("lattice_wd_rate", 0.2),
+                        drone_burst=config.get("lattice_drone_burst", 3),
+                        pilot_hz=config.get("lattice_pilot_rate", 1.0),
+                        home_hz=config.get("lattice_home_rate", 1.0),
+                        policies=policies,
                         source_name=config.get("lattice_source_name", "DragonSync"),
                         sandbox_token=sb or None,
+                        raw_publish=config.get("lattice_raw_publish", False),
+                        compress=config.get("lattice_compress", False),
                     )
                     logger.info("Lattice sink enabled.")
                 except Exception as e:
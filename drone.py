@@ -26,8 +26,7 @@ import time
 import math
 import logging
 import xml.sax.saxutils
-from typing import Optional
-from lxml import etree
+from typing import Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -51,9 +50,106 @@ UA_COT_TYPE_MAP = {
     15: 'b-m-p-s-m',    # Other
 }
 
+_COT_TIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%fZ'
+
+# Drone fields holding time.monotonic_ns() readings (0 = never)
+_MONOTONIC_FIELDS = ('last_update_time', 'last_sent_time', 'last_keepalive_time')
+
+# CoT documents are rendered straight from pre-encoded byte templates rather
+# than built as an lxml tree and serialized on every emission, so constant
+# markup (ce/le, color, precisionlocation, icons) is copied, never re-encoded.
+# The layout matches what etree.tostring(pretty_print=True,
+# xml_declaration=True) produced, so receivers see byte-identical messages.
+_DRONE_COT_HEADER = (
+    b"<?xml version='1.0' encoding='UTF-8'?>\n"
+    b'<event version="2.0" uid="%(uid)b" type="%(type)b" time="%(time)b" start="%(time)b" stale="%(stale)b" how="m-g">\n'
+)
+
+# Everything below <event> only depends on telemetry, so it is cached per
+# drone and reused until the next update().
+_DRONE_COT_BODY = (
+    b'  <point lat="%(lat)b" lon="%(lon)b" hae="%(hae)b" ce="35.0" le="999999"/>\n'
+    b'  <detail>\n'
+    b'    <contact callsign="%(uid)b"/>\n'
+    b'    <precisionlocation geopointsrc="gps" altsrc="gps"/>\n'
+    b'    <track course="%(course)b" speed="%(speed)b"/>\n'
+    b'    <remarks>%(remarks)b</remarks>\n'
+    b'    <color argb="-256"/>\n'
+    b'  </detail>\n'
+    b'</event>\n'
+)
+
+_MARKER_COT_TEMPLATE = (
+    b"<?xml version='1.0' encoding='UTF-8'?>\n"
+    b'<event version="2.0" uid="%(uid)b" type="b-m-p-s-m" time="%(time)b" start="%(time)b" stale="%(stale)b" how="m-g">\n'
+    b'  <point lat="%(lat)b" lon="%(lon)b" hae="%(hae)b" ce="35.0" le="999999"/>\n'
+    b'  <detail>\n'
+    b'    <contact callsign="%(uid)b"/>\n'
+    b'    <precisionlocation geopointsrc="gps" altsrc="gps"/>\n'
+    b'    <usericon iconsetpath="%(icon)b"/>\n'
+    b'    <remarks>%(remarks)b</remarks>\n'
+    b'  </detail>\n'
+    b'</event>\n'
+)
+
+_ICON_PILOT = b'com.atakmap.android.maps.public/Civilian/Person.png'
+_ICON_HOME = b'com.atakmap.android.maps.public/Civilian/House.png'
+
+_UA_COT_TYPE_BYTES = {k: v.encode('ascii') for k, v in UA_COT_TYPE_MAP.items()}
+_DEFAULT_COT_TYPE = b'a-u-A-M-H-R'
+
+_XML_ATTR_ENTITIES = {'"': '&quot;', '\n': '&#10;', '\r': '&#13;', '\t': '&#9;'}
+
+
+def _xml_attr(value) -> bytes:
+    """Escapes and encodes a value for use inside a double-quoted XML attribute."""
+    return xml.sax.saxutils.escape(str(value), _XML_ATTR_ENTITIES).encode('utf-8')
+
+
+def _xml_text(value: str) -> bytes:
+    """Escapes and encodes a value for use as XML element text."""
+    return xml.sax.saxutils.escape(value, {'\r': '&#13;'}).encode('utf-8')
+
+
+def _num(value) -> bytes:
+    """Encodes a numeric field the way str() renders it."""
+    return str(value).encode('utf-8')
+
+
+def _bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Initial great-circle bearing in degrees [0, 360) from point 1 to point 2."""
+    lat1 = math.radians(lat1)
+    lon1 = math.radians(lon1)
+    lat2 = math.radians(lat2)
+    lon2 = math.radians(lon2)
+    delta_lon = lon2 - lon1
+
+    x = math.sin(delta_lon) * math.cos(lat2)
+    y = (math.cos(lat1) * math.sin(lat2) -
+         math.sin(lat1) * math.cos(lat2) * math.cos(delta_lon))
+    theta = math.atan2(x, y)
+    return (math.degrees(theta) + 360) % 360
+
+
 class Drone:
     """Represents a drone and its telemetry data."""
 
+    # Fixed attribute layout: no per-instance __dict__, slot-offset access.
+    __slots__ = (
+        'id', 'id_type', 'ua_type', 'ua_type_name',
+        'operator_id_type', 'operator_id', 'op_status', 'height_type', 'ew_dir',
+        'direction', 'speed_multiplier', 'pressure_altitude',
+        'vertical_accuracy', 'horizontal_accuracy', 'baro_accuracy', 'speed_accuracy',
+        'timestamp', 'timestamp_accuracy',
+        'prev_lat', 'prev_lon',
+        'index', 'runtime', 'mac', 'rssi',
+        'lat', 'lon', 'speed', 'vspeed', 'alt', 'height',
+        'pilot_lat', 'pilot_lon', 'home_lat', 'home_lon', 'description',
+        'last_update_time', 'last_sent_time', 'last_sent_lat', 'last_sent_lon',
+        'caa_id', 'last_keepalive_time',
+        '_cot_body',
+    )
+
     def __init__(
         self,
         id: str,
@@ -132,12 +228,14 @@ class Drone:
         self.home_lon = home_lon
         self.description = description
 
-        self.last_update_time = time.time()
-        self.last_sent_time = 0.0
+        self.last_update_time = time.monotonic_ns()
+        # last_*_time fields are time.monotonic_ns() readings
+        self.last_sent_time = 0
         self.last_sent_lat = lat
         self.last_sent_lon = lon
         self.caa_id = caa_id
-        self.last_keepalive_time = 0.0
+        self.last_keepalive_time = 0
+        self._cot_body: Optional[bytes] = None
 
     def update(
         self,
@@ -235,21 +333,57 @@ class Drone:
         if caa_id:
             self.caa_id = caa_id
 
-        self.last_update_time = time.time()
+        self.last_update_time = time.monotonic_ns()
+        self._cot_body = None
 
         # fallback bearing calculation if no heading provided
         if self.direction is None and self.prev_lat is not None:
-            lat1 = math.radians(self.prev_lat)
-            lon1 = math.radians(self.prev_lon)
-            lat2 = math.radians(self.lat)
-            lon2 = math.radians(self.lon)
-            delta_lon = lon2 - lon1
-
-            x = math.sin(delta_lon) * math.cos(lat2)
-            y = (math.cos(lat1) * math.sin(lat2) -
-                 math.sin(lat1) * math.cos(lat2) * math.cos(delta_lon))
-            theta = math.atan2(x, y)
-            self.direction = (math.degrees(theta) + 360) % 360
+            self.direction = _bearing(self.prev_lat, self.prev_lon, self.lat, self.lon)
+
+    @classmethod
+    def batch_update_bearings(
+        cls,
+        prev_lats: Sequence[float],
+        prev_lons: Sequence[float],
+        lats: Sequence[float],
+        lons: Sequence[float],
+    ):
+        """
+        Computes fallback bearings for many drones at once.
+
+        Uses NumPy to evaluate the whole batch in one pass when it is installed;
+        otherwise falls back to the scalar calculation used by update().
+        Returns a NumPy array (or a list without NumPy) of degrees in [0, 360).
+        """
+        # Imported here so NumPy is only loaded when a batch is actually computed
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np is None:
+            return [_bearing(*p) for p in zip(prev_lats, prev_lons, lats, lons)]
+
+        lat1 = np.radians(np.asarray(prev_lats, dtype=float))
+        lon1 = np.radians(np.asarray(prev_lons, dtype=float))
+        lat2 = np.radians(np.asarray(lats, dtype=float))
+        lon2 = np.radians(np.asarray(lons, dtype=float))
+        delta_lon = lon2 - lon1
+
+        x = np.sin(delta_lon) * np.cos(lat2)
+        y = (np.cos(lat1) * np.sin(lat2) -
+             np.sin(lat1) * np.cos(lat2) * np.cos(delta_lon))
+        return (np.degrees(np.arctan2(x, y)) + 360) % 360
+
+    def to_dict(self) -> dict:
+        """Returns the drone's fields as a plain dict (e.g. for JSON publishing)."""
+        d = {name: getattr(self, name) for name in self.__slots__
+             if not name.startswith('_')}
+        # Publish timestamps as epoch seconds, not internal monotonic ns
+        wall, mono = time.time(), time.monotonic_ns()
+        for name in _MONOTONIC_FIELDS:
+            ns = d[name]
+            d[name] = wall - (mono - ns) / 1e9 if ns else 0.0
+        return d
 
     def to_cot_xml(self, stale_offset: Optional[float] = None) -> bytes:
         """Converts the drone's telemetry data to a CoT XML message, including a <track>."""
@@ -260,62 +394,44 @@ class Drone:
             stale = now + datetime.timedelta(minutes=10)
 
         # pick CoT type by UA index, fallback to rotary‑wing VTOL
-        cot_type = UA_COT_TYPE_MAP.get(self.ua_type, 'a-u-A-M-H-R')
-
-        event = etree.Element(
-            'event',
-            version='2.0',
-            uid=self.id,
-            type=cot_type,
-            time=now.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
-            start=now.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
-            stale=stale.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
-            how='m-g'
-        )
-
-        etree.SubElement(
-            event,
-            'point',
-            lat=str(self.lat),
-            lon=str(self.lon),
-            hae=str(self.alt),
-            ce='35.0',
-            le='999999'
-        )
-
-        detail = etree.SubElement(event, 'detail')
-        etree.SubElement(detail, 'contact', callsign=self.id)
-        etree.SubElement(detail, 'precisionlocation', geopointsrc='gps', altsrc='gps')
-
-        # include <track> so ATAK will draw a track
-        etree.SubElement(
-            detail,
-            'track',
-            course=str(self.direction or 0.0),
-            speed=str(self.speed or 0.0)
-        )
-
-        remarks = (
-            f"MAC: {self.mac}, RSSI: {self.rssi}dBm; "
-            f"ID Type: {self.id_type}; UA Type: {self.ua_type_name} "
-            f"({self.ua_type}); "
-            f"Operator ID: [{self.operator_id_type}: {self.operator_id}]; "
-            f"Speed: {self.speed} m/s; Vert Speed: {self.vspeed} m/s; "
-            f"Altitude: {self.alt} m; AGL: {self.height} m; "
-            f"Course: {self.direction}°; "
-            f"Index: {self.index}; Runtime: {self.runtime}s"
-        )
-        etree.SubElement(detail, 'remarks').text = xml.sax.saxutils.escape(remarks)
-        etree.SubElement(detail, 'color', argb='-256')
-        # dropped <usericon> so icon derives from event type
-
-        xml_bytes = etree.tostring(event, pretty_print=True,
-                                   xml_declaration=True, encoding='UTF-8')
+        cot_type = _UA_COT_TYPE_BYTES.get(self.ua_type, _DEFAULT_COT_TYPE)
+
+        uid = _xml_attr(self.id)
+        if self._cot_body is None:
+            remarks = (
+                f"MAC: {self.mac}, RSSI: {self.rssi}dBm; "
+                f"ID Type: {self.id_type}; UA Type: {self.ua_type_name} "
+                f"({self.ua_type}); "
+                f"Operator ID: [{self.operator_id_type}: {self.operator_id}]; "
+                f"Speed: {self.speed} m/s; Vert Speed: {self.vspeed} m/s; "
+                f"Altitude: {self.alt} m; AGL: {self.height} m; "
+                f"Course: {self.direction}°; "
+                f"Index: {self.index}; Runtime: {self.runtime}s"
+            )
+            # include <track> so ATAK will draw a track
+            # dropped <usericon> so icon derives from event type
+            self._cot_body = _DRONE_COT_BODY % {
+                b'uid': uid,
+                b'lat': _num(self.lat),
+                b'lon': _num(self.lon),
+                b'hae': _num(self.alt),
+                b'course': _num(self.direction or 0.0),
+                b'speed': _num(self.speed or 0.0),
+                b'remarks': _xml_text(xml.sax.saxutils.escape(remarks)),
+            }
+
+        xml_bytes = _DRONE_COT_HEADER % {
+            b'uid': uid,
+            b'type': cot_type,
+            b'time': now.strftime(_COT_TIME_FORMAT).encode('ascii'),
+            b'stale': stale.strftime(_COT_TIME_FORMAT).encode('ascii'),
+        } + self._cot_body
         logger.debug("CoT XML for drone '%s':\n%s", self.id, xml_bytes.decode('utf-8'))
         return xml_bytes
 
-    def to_pilot_cot_xml(self, stale_offset: Optional[float] = None) -> bytes:
-        """Generates a CoT XML message for the pilot location."""
+    def _marker_cot_xml(self, prefix: str, lat: float, lon: float, icon: bytes,
+                        remarks: str, stale_offset: Optional[float]) -> bytes:
+        """Renders a static pilot/home marker for this drone as CoT XML."""
         now = datetime.datetime.utcnow()
         if stale_offset is not None:
             stale = now + datetime.timedelta(seconds=stale_offset)
@@ -325,93 +441,37 @@ class Drone:
         base_id = self.id
         if base_id.startswith("drone-"):
             base_id = base_id[len("drone-"):]
-        uid = f"pilot-{base_id}"
-
-        event = etree.Element(
-            'event',
-            version='2.0',
-            uid=uid,
-            type='b-m-p-s-m',
-            time=now.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
-            start=now.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
-            stale=stale.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
-            how='m-g'
-        )
-        etree.SubElement(
-            event,
-            'point',
-            lat=str(self.pilot_lat),
-            lon=str(self.pilot_lon),
-            hae=str(self.alt),
-            ce='35.0',
-            le='999999'
-        )
+        uid = _xml_attr(f"{prefix}-{base_id}")
+
+        return _MARKER_COT_TEMPLATE % {
+            b'uid': uid,
+            b'time': now.strftime(_COT_TIME_FORMAT).encode('ascii'),
+            b'stale': stale.strftime(_COT_TIME_FORMAT).encode('ascii'),
+            b'lat': _num(lat),
+            b'lon': _num(lon),
+            b'hae': _num(self.alt),
+            b'icon': icon,
+            b'remarks': _xml_text(xml.sax.saxutils.escape(remarks)),
+        }
 
-        detail = etree.SubElement(event, 'detail')
-        callsign = f"pilot-{base_id}"
-        etree.SubElement(detail, 'contact', callsign=callsign)
-        etree.SubElement(detail, 'precisionlocation', geopointsrc='gps', altsrc='gps')
-        etree.SubElement(
-        detail,
-        'usericon',
-        iconsetpath='com.atakmap.android.maps.public/Civilian/Person.png'
-        )
-        etree.SubElement(detail, 'remarks').text = xml.sax.saxutils.escape(
-            f"Pilot location for drone {self.id}"
+    def to_pilot_cot_xml(self, stale_offset: Optional[float] = None) -> bytes:
+        """Generates a CoT XML message for the pilot location."""
+        xml_bytes = self._marker_cot_xml(
+            'pilot', self.pilot_lat, self.pilot_lon,
+            _ICON_PILOT,
+            f"Pilot location for drone {self.id}",
+            stale_offset,
         )
-
-        xml_bytes = etree.tostring(event, pretty_print=True,
-                                   xml_declaration=True, encoding='UTF-8')
         logger.debug("CoT XML for pilot '%s':\n%s", self.id, xml_bytes.decode('utf-8'))
         return xml_bytes
 
     def to_home_cot_xml(self, stale_offset: Optional[float] = None) -> bytes:
         """Generates a CoT XML message for the home location."""
-        now = datetime.datetime.utcnow()
-        if stale_offset is not None:
-            stale = now + datetime.timedelta(seconds=stale_offset)
-        else:
-            stale = now + datetime.timedelta(minutes=10)
-
-        base_id = self.id
-        if base_id.startswith("drone-"):
-            base_id = base_id[len("drone-"):]
-        uid = f"home-{base_id}"
-
-        event = etree.Element(
-            'event',
-            version='2.0',
-            uid=uid,
-            type='b-m-p-s-m',
-            time=now.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
-            start=now.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
-            stale=stale.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
-            how='m-g'
-        )
-        etree.SubElement(
-            event,
-            'point',
-            lat=str(self.home_lat),
-            lon=str(self.home_lon),
-            hae=str(self.alt),
-            ce='35.0',
-            le='999999'
+        xml_bytes = self._marker_cot_xml(
+            'home', self.home_lat, self.home_lon,
+            _ICON_HOME,
+            f"Home location for drone {self.id}",
+            stale_offset,
         )
-
-        detail = etree.SubElement(event, 'detail')
-        callsign = f"home-{base_id}"
-        etree.SubElement(detail, 'contact', callsign=callsign)
-        etree.SubElement(detail, 'precisionlocation', geopointsrc='gps', altsrc='gps')
-        etree.SubElement(
-        detail,
-        'usericon',
-        iconsetpath='com.atakmap.android.maps.public/Civilian/House.png'
-        )
-        etree.SubElement(detail, 'remarks').text = xml.sax.saxutils.escape(
-            f"Home location for drone {self.id}"
-        )
-
-        xml_bytes = etree.tostring(event, pretty_print=True,
-                                   xml_declaration=True, encoding='UTF-8')
         logger.debug("CoT XML for home '%s':\n%s", self.id, xml_bytes.decode('utf-8'))
         return xml_bytes
@@ -23,11 +23,26 @@
 from __future__ import annotations
 
 import logging
+import math
+import random
+import threading
 import time
-from typing import Optional, Dict, Any
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Tuple
 import datetime as dt
+import functools
+import gzip
+import json
 import os
 
+try:
+    import orjson  # optional: faster JSON for the raw publish path
+except ImportError:
+    orjson = None
+
 # ────────────────────────────────────────────────────────────────────────────────
 # Anduril SDK imports
 # ────────────────────────────────────────────────────────────────────────────────
@@ -56,6 +71,19 @@ try:
     except Exception:
         RequestOptions = None  # type: ignore
 
+    # The SDK's HTTP transport; used to hand it a tuned, shared pool
+    try:
+        import httpx  # type: ignore
+    except Exception:
+        httpx = None  # type: ignore
+
+    # HTTP/2 lets concurrent publishes share one connection; needs the h2 extra
+    try:
+        import h2  # type: ignore  # noqa: F401
+        _HTTP2 = httpx is not None
+    except Exception:
+        _HTTP2 = False
+
 except Exception as e:
     _IMPORT_ERROR = e
     Lattice = None  # type: ignore
@@ -63,26 +91,102 @@ except Exception as e:
     Classification = ClassificationInformation = None  # type: ignore
     MilEnvironment = None  # type: ignore
     RequestOptions = None  # type: ignore
+    httpx = None  # type: ignore
+    _HTTP2 = False
     _SDK_VERSION = "unknown"
 else:
     _IMPORT_ERROR = None
     _SDK_VERSION = getattr(_anduril_mod, "__version__", "unknown")
 
 _log = logging.getLogger(__name__)
+_MODULE_PATH = os.path.abspath(__file__)
+
+# Rate limiting runs on the monotonic clock so wall-clock jumps (NTP, VM
+# resume) cannot stall or flood publishes. Entity timestamps stay wall-clock.
+_mono = time.monotonic
+
+# Connection pool for the Lattice client: publishes reuse warm TCP+TLS
+# sockets instead of paying a handshake per request.
+_HTTP_MAX_CONNECTIONS = 16
+_HTTP_KEEPALIVE_EXPIRY = 300.0
+# Per-phase timeouts (s); pool is how long a publish waits for a free socket
+_HTTP_TIMEOUTS = {"connect": 5.0, "read": 10.0, "write": 10.0, "pool": 2.0}
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Helpers
 # ────────────────────────────────────────────────────────────────────────────────
-def _now_utc() -> dt.datetime:
-    return dt.datetime.now(dt.timezone.utc)
-
-def _valid_latlon(lat: Optional[float], lon: Optional[float]) -> bool:
+def _build_http_client():
+    """
+    Return a pooled httpx.Client for the SDK, or None if httpx is unavailable.
+    """
+    if httpx is None:
+        return None
     try:
+        return httpx.Client(
+            http2=_HTTP2,
+            limits=httpx.Limits(
+                max_connections=_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=_HTTP_MAX_CONNECTIONS,
+                keepalive_expiry=_HTTP_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(**_HTTP_TIMEOUTS),
+        )
+    except Exception as e:
+        _log.warning("Could not build pooled HTTP client, using SDK default: %s", e)
+        return None
+
+def _latlon(lat: Any, lon: Any) -> Optional[Tuple[float, float]]:
+    """
+    (lat, lon) as floats if both are valid coordinates, else None.
+    Floats pass straight through; ints and numeric strings are converted
+    once. None, "N/A" and NaN are rejected without raising. This is the
+    coordinate contract for every publish_* kind.
+    """
+    if type(lat) is not float or type(lon) is not float:
         if lat is None or lon is None:
-            return False
-        return -90.0 <= float(lat) <= 90.0 and -180.0 <= float(lon) <= 180.0
-    except Exception:
-        return False
+            return None
+        try:
+            lat, lon = float(lat), float(lon)
+        except (TypeError, ValueError):
+            return None
+    if -90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0:
+        return lat, lon
+    return None
+
+def _is_transient(exc: Exception) -> bool:
+    """True for errors worth retrying: timeouts, connection failures, HTTP 429/5xx."""
+    if httpx is not None and isinstance(exc, (httpx.TimeoutException, httpx.NetworkError)):
+        return True
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+def _factory(model):
+    """
+    Unvalidated constructor for a per-publish model: pydantic v2
+    model_construct when available, else the validating class itself.
+    Only used for values we have already checked (lat/lon, strings, times).
+    """
+    return getattr(model, "model_construct", model)
+
+def _changed(prev: tuple, cur: tuple) -> bool:
+    """
+    True if (lat, lon, hae, name) differs from the last published state by
+    more than the delta gate. Uses an equirectangular approximation, which
+    is plenty at sub-metre scale.
+    """
+    plat, plon, phae, pname = prev
+    lat, lon, hae, name = cur
+    if name != pname:
+        return True
+    dy = (lat - plat) * _M_PER_DEG_LAT
+    dx = (lon - plon) * _M_PER_DEG_LAT * math.cos(math.radians(lat))
+    if dx * dx + dy * dy >= _GATE_HORIZ_M * _GATE_HORIZ_M:
+        return True
+    if hae is None or phae is None:
+        return hae is not phae
+    return abs(hae - phae) >= _GATE_VERT_M
 
 def _air_env_value():
     """
@@ -95,6 +199,229 @@ def _air_env_value():
                 return getattr(MilEnvironment, attr)
     return "ENVIRONMENT_AIR"
 
+# Invariant entity components, built once (None when the SDK is missing).
+if _IMPORT_ERROR is None:
+    _AIR_ENV = _air_env_value()
+    _CLS_UNCLASS = Classification(
+        default=ClassificationInformation(level="CLASSIFICATION_LEVELS_UNCLASSIFIED")
+    )
+    _ONT_WD = Ontology(template="TEMPLATE_TRACK", platform_type="Ground Sensor")
+    _ONT_DRONE = Ontology(template="TEMPLATE_TRACK", platform_type="Small UAS")
+    _ONT_PILOT = Ontology(template="TEMPLATE_TRACK", platform_type="Operator")
+    _ONT_HOME = Ontology(template="TEMPLATE_TRACK", platform_type="Home Point")
+    # WarDragon: keep only disposition; omit environment to avoid enum mismatches
+    _MV_GROUND_NEUTRAL = MilView(disposition="DISPOSITION_NEUTRAL")
+    _MV_AIR_NEUTRAL = MilView(environment=_AIR_ENV, disposition="DISPOSITION_NEUTRAL")
+    # Pilot/home: omit env & disposition for max compatibility
+    _MV_EMPTY = MilView()
+    # Per-publish models, built from already-validated values
+    _make_position = _factory(Position)
+    _make_location = _factory(Location)
+    _make_aliases = _factory(Aliases)
+    _make_provenance = _factory(Provenance)
+else:
+    _AIR_ENV = _CLS_UNCLASS = None
+    _ONT_WD = _ONT_DRONE = _ONT_PILOT = _ONT_HOME = None
+    _MV_GROUND_NEUTRAL = _MV_AIR_NEUTRAL = _MV_EMPTY = None
+    _make_position = _make_location = _make_aliases = _make_provenance = None
+
+# Per-kind provenance data_type and default entity lifetime (expiry offset)
+_KIND_META = {
+    "system": ("telemetry", dt.timedelta(minutes=10)),
+    "drone": ("drone-telemetry", dt.timedelta(minutes=5)),
+    "pilot": ("pilot-position", dt.timedelta(minutes=30)),
+    "home": ("home-position", dt.timedelta(hours=4)),
+}
+
+# Per-kind publish policy: token-bucket refill rate (Hz) and burst, forced
+# republish interval for unchanged entities (s), and entity lifetime.
+_Policy = namedtuple("_Policy", "rate burst heartbeat expiry")
+
+
+def _make_policy(ttl: dt.timedelta, rate: float, burst: float,
+                 override: Dict[str, Any]) -> _Policy:
+    """
+    Build a kind's _Policy from its defaults plus optional overrides
+    ("rate", "burst", "heartbeat" in seconds, "expiry" in seconds or as a
+    timedelta). The heartbeat defaults to, and is capped at, one minute
+    before expiry so an unchanged entity never lapses in Lattice.
+    """
+    expiry = override.get("expiry", ttl)
+    if not isinstance(expiry, dt.timedelta):
+        expiry = dt.timedelta(seconds=float(expiry))
+    refresh = expiry.total_seconds() - 60.0
+    heartbeat = min(float(override.get("heartbeat", refresh)), refresh)
+    return _Policy(
+        rate=max(float(override.get("rate", rate)), 1e-6),
+        burst=float(max(override.get("burst", burst), 1)),
+        heartbeat=max(float(heartbeat), 1.0),
+        expiry=expiry,
+    )
+
+# Open LatticeSink instances in this process; more than one means duplicate
+# pools, flush threads and independent rate limits for the same entities.
+_open_sinks = 0
+_open_sinks_lock = threading.Lock()
+
+# Shared read-only stand-in for a missing gps_data block
+_EMPTY = MappingProxyType({})
+
+# Upper bound on entities waiting for the flush thread
+_MAX_PENDING = 1024
+
+# Pending size at which the flush thread is woken before its interval ends
+_FLUSH_BATCH = 100
+
+# Delta gate: movement below these is not worth a republish (metres)
+_GATE_HORIZ_M = 0.5
+_GATE_VERT_M = 0.5
+_M_PER_DEG_LAT = 111320.0
+
+# Size above which stale entries are pruned from the unchanged-state table
+_LAST_STATE_PRUNE_SIZE = 1024
+
+# Default publishes in flight at once per flush (capped at the HTTP pool size)
+_PUBLISH_WORKERS = 8
+
+# Global cap on publishes: at most max_rps * window over any rolling window
+_RATE_WINDOW_S = 10.0
+
+# Size above which idle (refilled) per-entity token buckets are pruned
+_BUCKET_PRUNE_SIZE = 1024
+
+# Transient failures (timeouts, connection errors, 429/5xx) are retried with
+# jittered exponential backoff; after enough consecutive failed entities the
+# circuit opens and the queue is held instead of hammering the server.
+_RETRY_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 0.05
+_RETRY_MAX_DELAY = 0.5
+_CIRCUIT_FAILURES = 5
+_CIRCUIT_OPEN_S = 1.0
+
+# Pilot/home: entity_id suffix, default alias prefix
+_GROUND_KINDS = {
+    "pilot": ("-pilot", "Pilot of"),
+    "home": ("-home", "Home of"),
+}
+
+# Bound on cached entity id / alias strings per helper below
+_ID_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=_ID_CACHE_SIZE)
+def _system_ids(serial: str) -> Tuple[str, str]:
+    """(entity_id, alias) for a WarDragon serial."""
+    return f"wardragon-{serial}", f"WarDragon {serial}"
+
+
+@functools.lru_cache(maxsize=_ID_CACHE_SIZE)
+def _ground_ids(kind: str, entity_base_id: str) -> Tuple[str, str]:
+    """(entity_id, default alias) for a pilot/home point of entity_base_id."""
+    id_suffix, name_prefix = _GROUND_KINDS[kind]
+    return f"{entity_base_id}{id_suffix}", f"{name_prefix} {entity_base_id}"
+
+@functools.lru_cache(maxsize=_ID_CACHE_SIZE)
+def _aliases(name: str):
+    """Shared Aliases model per display name; never mutated after creation."""
+    return _make_aliases(name=name)
+
+# Per-kind ontology / mil_view for the SDK (typed) publish path
+_KIND_MODELS = {
+    "system": (_ONT_WD, _MV_GROUND_NEUTRAL),
+    "drone": (_ONT_DRONE, _MV_AIR_NEUTRAL),
+    "pilot": (_ONT_PILOT, _MV_EMPTY),
+    "home": (_ONT_HOME, _MV_EMPTY),
+}
+
+# The same components in Lattice REST JSON form, baked into per-kind byte
+# templates for the raw publish path
+_CLS_UNCLASS_JSON = {"default": {"level": "CLASSIFICATION_LEVELS_UNCLASSIFIED"}}
+_KIND_JSON = {
+    "system": (
+        {"template": "TEMPLATE_TRACK", "platformType": "Ground Sensor"},
+        {"disposition": "DISPOSITION_NEUTRAL"},
+    ),
+    "drone": (
+        {"template": "TEMPLATE_TRACK", "platformType": "Small UAS"},
+        {"environment": "ENVIRONMENT_AIR", "disposition": "DISPOSITION_NEUTRAL"},
+    ),
+    "pilot": ({"template": "TEMPLATE_TRACK", "platformType": "Operator"}, {}),
+    "home": ({"template": "TEMPLATE_TRACK", "platformType": "Home Point"}, {}),
+}
+
+# Statuses meaning the server did not accept our hand-built JSON
+_RAW_SCHEMA_ERRORS = frozenset((400, 404, 405, 415, 422))
+
+# Raw bodies at least this large are gzipped when compression is on; below
+# it the gzip header/trailer eats most of the saving.
+_GZIP_MIN_BYTES = 512
+
+
+def _typed_builder(kind: str, req_opts: Any):
+    """
+    Return build(entity_id, name, lat, lon, hae, stamp) -> publish_entity
+    kwargs for one kind, with that kind's invariant models and the request
+    options bound in the closure rather than looked up per publish.
+    """
+    ontology, mil_view = _KIND_MODELS[kind]
+    classification = _CLS_UNCLASS
+    make_position, make_location = _make_position, _make_location
+
+    def build(entity_id: str, name: str, lat: float, lon: float,
+              hae: Optional[float], stamp) -> Dict[str, Any]:
+        if hae is None:
+            position = make_position(latitude_degrees=lat, longitude_degrees=lon)
+        else:
+            position = make_position(latitude_degrees=lat, longitude_degrees=lon,
+                                     height_above_ellipsoid_meters=hae)
+        return {
+            "entity_id": entity_id,
+            "is_live": True,
+            "location": make_location(position=position),
+            "ontology": ontology,
+            "mil_view": mil_view,
+            "provenance": stamp[0],
+            "aliases": _aliases(name),
+            "expiry_time": stamp[1],
+            "data_classification": classification,
+            "request_options": req_opts,
+        }
+
+    return build
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _raw_template(kind: str, source_name: str) -> bytes:
+    """
+    Pre-serialize everything constant about a kind's entity JSON, leaving
+    slots for: entityId, lat, lon, optional height member, source update
+    time, alias name, expiry time. lat/lon are %r slots taking floats; the
+    rest are %b (strings arrive already JSON-quoted, times without quotes).
+    """
+    data_type, _ = _KIND_META[kind]
+    ontology, mil_view = _KIND_JSON[kind]
+    tmpl = _dumps({
+        "entityId": "@ID@",
+        "isLive": True,
+        "location": {"position": {"latitudeDegrees": "@LAT@", "longitudeDegrees": "@LON@"}},
+        "ontology": ontology,
+        "milView": mil_view,
+        "provenance": {"dataType": data_type, "integrationName": source_name,
+                       "sourceUpdateTime": "@NOW@"},
+        "aliases": {"name": "@NAME@"},
+        "expiryTime": "@EXP@",
+        "dataClassification": _CLS_UNCLASS_JSON,
+    }).replace(b"%", b"%%")
+    for slot, fill in ((b'"@ID@"', b"%b"), (b'"@LAT@"', b"%r"), (b'"@LON@"', b"%r%b"),
+                       (b"@NOW@", b"%b"), (b'"@NAME@"', b"%b"), (b"@EXP@", b"%b")):
+        tmpl = tmpl.replace(slot, fill, 1)
+    return tmpl
+
 # ────────────────────────────────────────────────────────────────────────────────
 # LatticeSink (minimal publish)
 # ────────────────────────────────────────────────────────────────────────────────
@@ -107,8 +434,20 @@ class LatticeSink:
     - WarDragon/pilot/home: omit environment to avoid enum quirks; disposition
       only where we know it’s safe.
     - Drone: set environment=AIR and disposition=NEUTRAL.
+    - publish_* only queue the entity; a background thread flushes the
+      queue every flush_interval seconds. Call close() on shutdown.
     """
 
+    __slots__ = (
+        "client", "source_name", "_sandbox_token", "_req_opts", "_builders", "_http",
+        "_client_kwargs", "_reconnect_interval", "_client_born",
+        "_raw_url", "_raw_headers", "_raw_templates", "_raw_gzip", "_raw_headers_gz",
+        "_policies", "_buckets", "_rate_lock", "_last_state",
+        "_pending", "_pending_lock", "_flush_interval", "_stop", "_wake", "_flush_thread",
+        "_executor", "_workers", "_stamp_tick",
+        "_published", "_failed", "_dropped", "_window", "_window_cap", "_failures", "_circuit_until",
+    )
+
     def __init__(
         self,
         *,
@@ -116,8 +455,19 @@ class LatticeSink:
         base_url: Optional[str] = None,
         drone_hz: float = 1.0,
         wardragon_hz: float = 0.2,
+        drone_burst: int = 3,
+        wardragon_burst: int = 1,
+        pilot_hz: float = 1.0,
+        home_hz: float = 1.0,
+        policies: Optional[Dict[str, Dict[str, Any]]] = None,
         source_name: str = "DragonSync",
         sandbox_token: Optional[str] = None,
+        flush_interval: float = 0.1,
+        max_rps: float = 20.0,
+        reconnect_interval: Optional[float] = None,
+        publish_workers: int = _PUBLISH_WORKERS,
+        raw_publish: bool = False,
+        compress: bool = False,
     ) -> None:
         if _IMPORT_ERROR is not None:
             raise RuntimeError(f"anduril SDK import failed: {_IMPORT_ERROR}") from _IMPORT_ERROR
@@ -129,156 +479,514 @@ class LatticeSink:
 
         headers = {"anduril-sandbox-authorization": f"Bearer {self._sandbox_token}"} if self._sandbox_token else None
         self._req_opts = None
+        self._http = _build_http_client()
+        client_kwargs: Dict[str, Any] = {"token": token}
+        if base_url:
+            client_kwargs["base_url"] = base_url
         try:
-            if base_url:
-                self.client = Lattice(token=token, base_url=base_url, headers=headers)  # type: ignore
-            else:
-                self.client = Lattice(token=token, headers=headers)  # type: ignore
-            _log.info("LatticeSink ACTIVE. file=%s", os.path.abspath(__file__))
+            self.client = self._new_client(**client_kwargs, headers=headers)
+            client_kwargs["headers"] = headers
+            _log.info("LatticeSink ACTIVE. file=%s", _MODULE_PATH)
             _log.info("anduril SDK version: %s", _SDK_VERSION)
         except TypeError:
-            if base_url:
-                self.client = Lattice(token=token, base_url=base_url)  # type: ignore
-            else:
-                self.client = Lattice(token=token)  # type: ignore
+            self.client = self._new_client(**client_kwargs)
             if self._sandbox_token and RequestOptions is not None:
                 self._req_opts = RequestOptions(
                     additional_headers={"anduril-sandbox-authorization": f"Bearer {self._sandbox_token}"}
                 )
-            _log.info("LatticeSink ACTIVE (fallback headers). file=%s", os.path.abspath(__file__))
+            _log.info("LatticeSink ACTIVE (fallback headers). file=%s", _MODULE_PATH)
             _log.info("anduril SDK version: %s", _SDK_VERSION)
+        self._builders = {kind: _typed_builder(kind, self._req_opts) for kind in _KIND_META}
+
+        # Kept so the client can be rebuilt by _reconnect()
+        self._client_kwargs = client_kwargs
+        self._reconnect_interval = reconnect_interval
+        self._client_born = _mono()
+        if self._http is not None:
+            _log.info("Lattice HTTP pool: max_connections=%d keepalive_expiry=%.0fs http2=%s",
+                      _HTTP_MAX_CONNECTIONS, _HTTP_KEEPALIVE_EXPIRY, _HTTP2)
+
+        # Optional raw path: PUT pre-serialized JSON on the pooled client and
+        # skip SDK model validation/encoding. Falls back to the SDK for good
+        # if the server rejects the payload shape.
+        self._raw_url: Optional[str] = None
+        self._raw_headers: Dict[str, str] = {}
+        self._raw_templates: Dict[str, bytes] = {}
+        self._raw_gzip = False
+        self._raw_headers_gz: Dict[str, str] = {}
+        if raw_publish:
+            if self._http is None or not base_url:
+                _log.warning("Lattice raw publish needs httpx and an explicit base_url; using SDK path.")
+            else:
+                self._raw_url = f"{base_url.rstrip('/')}/api/v1/entities"
+                self._raw_headers = {
+                    "Authorization": f"Bearer {token}",
+                    "Content-Type": "application/json",
+                }
+                if self._sandbox_token:
+                    self._raw_headers["anduril-sandbox-authorization"] = f"Bearer {self._sandbox_token}"
+                self._raw_templates = {kind: _raw_template(kind, source_name) for kind in _KIND_META}
+                # Optional gzip request bodies for constrained (cellular/satcom) links
+                self._raw_gzip = bool(compress)
+                self._raw_headers_gz = dict(self._raw_headers, **{"Content-Encoding": "gzip"})
+                _log.info("Lattice raw publish enabled (%s%s)", "orjson" if orjson is not None else "json",
+                          ", gzip" if self._raw_gzip else "")
+        elif compress:
+            _log.warning("Lattice compression only applies to the raw publish path; ignoring.")
 
-        # Simple rate limits
-        self._periods = {
-            "drone": 1.0 / max(drone_hz, 1e-6),
-            "wd": 1.0 / max(wardragon_hz, 1e-6),
-            "pilot": 1.0,  # 1 Hz cap
-            "home": 1.0,
+        # Rate, burst, heartbeat and expiry per kind; the *_hz / *_burst
+        # arguments are the defaults, `policies` can override any field.
+        defaults = {
+            "system": (wardragon_hz, wardragon_burst),
+            "drone": (drone_hz, drone_burst),
+            "pilot": (pilot_hz, 1),
+            "home": (home_hz, 1),
         }
-        self._last_send = {k: 0.0 for k in self._periods.keys()}
+        policies = policies or {}
+        self._policies = {
+            kind: _make_policy(ttl, *defaults[kind], policies.get(kind) or {})
+            for kind, (_, ttl) in _KIND_META.items()
+        }
+        # [tokens, last refill (monotonic)] per (kind, entity); buckets are
+        # per entity so one drone cannot starve another.
+        self._buckets: Dict[Any, list] = {}
+        self._rate_lock = threading.Lock()
+        # Send times over the last _RATE_WINDOW_S, so a flood of new entity
+        # ids cannot multiply the total publish rate without bound.
+        self._window: deque = deque()
+        self._window_cap = max(int(max_rps * _RATE_WINDOW_S), 1)
 
-    def _rate_ok(self, key: str) -> bool:
-        now = time.time()
-        if now - self._last_send.get(key, 0.0) >= self._periods.get(key, 0.0):
-            self._last_send[key] = now
-            return True
-        return False
+        # Last published (lat, lon, hae, name) per entity and when it must be
+        # re-sent anyway (the kind's heartbeat) so it does not expire in Lattice.
+        self._last_state: Dict[str, Any] = {}
 
-    # ───────────────────────────── WarDragon (ground) ─────────────────────────────
-    def publish_system(self, s: Dict[str, Any]) -> None:
+        # Entities are coalesced by entity_id (newer state overwrites pending
+        # state) and published from a background thread, so callers never
+        # block on HTTP and bursts go out back-to-back on one connection.
+        self._pending: Dict[str, Any] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_interval = max(float(flush_interval), 0.01)
+        self._failures = 0
+        self._circuit_until = -math.inf
+        # Counters for stats(); _dropped is guarded by _pending_lock, the
+        # others are only touched by the flush thread.
+        self._published = 0
+        self._failed = 0
+        self._dropped = 0
+        self._stamp_tick = (None, None, None, {})
+        self._workers = min(max(int(publish_workers), 1), _HTTP_MAX_CONNECTIONS)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._workers, thread_name_prefix="lattice-publish"
+        )
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, name="lattice-flush", daemon=True
+        )
+        self._flush_thread.start()
+
+        global _open_sinks
+        with _open_sinks_lock:
+            _open_sinks += 1
+            if _open_sinks > 1:
+                _log.warning("%d LatticeSink instances are open; rate limits and "
+                             "connection pools are not shared between them.", _open_sinks)
+
+    def _new_client(self, **kwargs):
         """
-        Publish WarDragon position as a minimal ground track.
+        Construct the Lattice client on our pooled httpx.Client when the SDK
+        accepts one (httpx_client=); otherwise let the SDK build its own.
         """
-        if not self._rate_ok("wd"):
-            return
+        if self._http is not None:
+            try:
+                return Lattice(httpx_client=self._http, **kwargs)  # type: ignore
+            except TypeError:
+                pass
+        return Lattice(**kwargs)  # type: ignore
+
+    def _rate_ok(self, kind: str, entity_id: str) -> bool:
+        key = (kind, entity_id)
+        policy = self._policies[kind]
+        burst = policy.burst
+        # publish_system and the drone/pilot/home publishes arrive on
+        # different threads; refill-and-take must be atomic per bucket.
+        with self._rate_lock:
+            now = _mono()
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= _BUCKET_PRUNE_SIZE:
+                    self._prune_buckets(now)
+                self._buckets[key] = [burst - 1.0, now]
+                return True
+            tokens = min(burst, bucket[0] + (now - bucket[1]) * policy.rate)
+            bucket[1] = now
+            if tokens >= 1.0:
+                bucket[0] = tokens - 1.0
+                return True
+            bucket[0] = tokens
+            return False
 
-        serial = str(s.get("serial_number", "unknown")) or "unknown"
-        gps = s.get("gps_data", {}) or {}
-        lat = gps.get("latitude")
-        lon = gps.get("longitude")
-        hae = gps.get("altitude")
-        if not _valid_latlon(lat, lon):
+    def _prune_buckets(self, now: float) -> None:
+        """Forget buckets that have refilled completely (entity gone quiet). Caller holds _rate_lock."""
+        policies = self._policies
+        self._buckets = {
+            key: b for key, b in self._buckets.items()
+            if b[0] + (now - b[1]) * policies[key[0]].rate < policies[key[0]].burst
+        }
+
+    # ───────────────────────────── Batching ─────────────────────────────────────
+    def _enqueue(self, kind: str, entity_id: str, name: str, lat: float, lon: float,
+                 hae: Any) -> None:
+        # Normalize numbers once here so the publish paths never convert
+        if type(lat) is not float:
+            lat = float(lat)
+        if type(lon) is not float:
+            lon = float(lon)
+        if hae is not None and not isinstance(hae, float):
+            try:
+                hae = float(hae)
+            except (TypeError, ValueError):
+                hae = None
+        if hae is not None and not math.isfinite(hae):
+            hae = None
+
+        # Skip updates that have not moved (or been renamed) since the last
+        # successful publish, unless it is time to refresh the expiry.
+        state = (lat, lon, hae, name)
+        last = self._last_state.get(entity_id)
+        if last is not None and _mono() < last[1] and not _changed(last[0], state):
             return
 
-        entity_id = f"wardragon-{serial}"
-        alias_name = f"WarDragon {serial}"
+        with self._pending_lock:
+            pending = self._pending
+            if entity_id not in pending and len(pending) >= _MAX_PENDING:
+                # Flush thread is behind: drop the oldest queued entity
+                pending.pop(next(iter(pending)))
+                self._dropped += 1
+            pending[entity_id] = (kind, name, lat, lon, hae, state)
+            full = len(pending) >= _FLUSH_BATCH
+        if full:
+            self._wake.set()
 
-        location = Location(position=Position(latitude_degrees=float(lat), longitude_degrees=float(lon)))
+    def _flush_loop(self) -> None:
+        # Flush every flush_interval, or as soon as _FLUSH_BATCH entities wait
+        while True:
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                self._finish()
+                break
+            self.flush()
+            if self._reconnect_interval and _mono() - self._client_born >= self._reconnect_interval:
+                self._reconnect()
+
+    def _reconnect(self) -> None:
+        """
+        Replace the HTTP pool and SDK client so long-lived connections that the
+        remote or a proxy silently dropped are not reused forever. Called from
+        the flush thread between flushes, so no publish is in flight.
+        """
+        old_http, old_client = self._http, self.client
+        self._client_born = _mono()
         try:
-            if hae is not None:
-                location.position.height_above_ellipsoid_meters = float(hae)  # type: ignore[attr-defined]
-        except Exception:
-            pass
-
-        ontology = Ontology(template="TEMPLATE_TRACK", platform_type="Ground Sensor")
-        # Keep only disposition; omit environment to avoid enum mismatches
-        mil_view = MilView(disposition="DISPOSITION_NEUTRAL")
-
-        provenance = Provenance(
-            data_type="telemetry",
-            integration_name=self.source_name,
-            source_update_time=_now_utc().isoformat(),
-        )
-        aliases = Aliases(name=alias_name)
-        expiry_time = _now_utc() + dt.timedelta(minutes=10)
+            self._http = _build_http_client()
+            self.client = self._new_client(**self._client_kwargs)
+        except Exception as e:
+            if self._http is not None and self._http is not old_http:
+                self._http.close()
+            self._http, self.client = old_http, old_client
+            _log.warning("Lattice client recycle failed; keeping current client: %.200s", e)
+            return
+        if old_http is not None:
+            try:
+                old_http.close()
+            except Exception:
+                pass
+        _log.debug("Lattice client recycled")
+
+    def flush(self) -> None:
+        """Publish every pending entity now (unless the circuit is open)."""
+        if _mono() < self._circuit_until:
+            return
+        with self._pending_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, {}
+
+        # One wall-clock stamp per second: provenance and expiry (and their
+        # formatted strings) are shared by every entity of the same kind
+        # flushed within that second.
+        sec = int(time.time())
+        if sec != self._stamp_tick[0]:
+            now = dt.datetime.fromtimestamp(sec, dt.timezone.utc)
+            self._stamp_tick = (sec, now, now.isoformat(), {})
+        _, now, iso_now, stamps = self._stamp_tick
+
+        # The SDK has no bulk publish endpoint; publish up to publish_workers
+        # entities concurrently over the pooled client. Results are handled
+        # here on the flush thread, so failure/state bookkeeping needs no lock.
+        items = list(batch.items())
+        workers = self._workers
+        for start in range(0, len(items), workers):
+            if _mono() < self._circuit_until:
+                self._requeue(items[start:])
+                break
+            chunk = items[start:start + workers]
+            admitted = self._admit(len(chunk))
+            capped = admitted < len(chunk)
+            if capped:
+                # Over the global cap: hold the rest for a later flush
+                _log.debug("Lattice publish cap reached; deferring %d entities",
+                           len(items) - start - admitted)
+                self._requeue(items[start + admitted:])
+                chunk = chunk[:admitted]
+                if not chunk:
+                    break
+            if len(chunk) == 1:
+                results = [self._try_send(chunk[0], stamps, now, iso_now)]
+            else:
+                results = self._executor.map(
+                    self._try_send, chunk, repeat(stamps), repeat(now), repeat(iso_now)
+                )
+            for (entity_id, entry), err in zip(chunk, results):
+                kind, state = entry[0], entry[5]
+                if err is not None:
+                    _log.warning("Lattice publish_%s failed for %s: %.200s", kind, entity_id, err)
+                    self._failed += 1
+                    self._failures += 1
+                    # A drone's next update supersedes it; ground positions
+                    # change rarely, so keep them for the next flush.
+                    if kind != "drone" and _is_transient(err):
+                        self._requeue(((entity_id, entry),))
+                    if self._failures >= _CIRCUIT_FAILURES:
+                        _log.warning("Lattice: %d consecutive publish failures; pausing for %.1fs",
+                                     self._failures, _CIRCUIT_OPEN_S)
+                        self._failures = 0
+                        self._circuit_until = _mono() + _CIRCUIT_OPEN_S
+                else:
+                    self._published += 1
+                    self._failures = 0
+                    self._last_state[entity_id] = (state, _mono() + self._policies[kind].heartbeat)
+            if capped:
+                break
 
+        # Forget entities whose refresh deadline has passed once the table grows
+        if len(self._last_state) > _LAST_STATE_PRUNE_SIZE:
+            now_mono = _mono()
+            self._last_state = {k: v for k, v in self._last_state.items() if v[1] > now_mono}
+
+    def _admit(self, n: int) -> int:
+        """Reserve up to n publishes in the sliding window; return how many."""
+        now = _mono()
+        window = self._window
+        horizon = now - _RATE_WINDOW_S
+        while window and window[0] <= horizon:
+            window.popleft()
+        n = min(n, self._window_cap - len(window))
+        window.extend(repeat(now, n))
+        return n
+
+    def _try_send(self, item, stamps: Dict[Any, Any], now: dt.datetime,
+                  iso_now: str) -> Optional[Exception]:
+        """Run _send for one (entity_id, entry) pair; return the error, if any."""
+        entity_id, (kind, name, lat, lon, hae, _) = item
         try:
-            self.client.entities.publish_entity(
-                entity_id=entity_id,
-                is_live=True,
-                location=location,
-                ontology=ontology,
-                mil_view=mil_view,
-                provenance=provenance,
-                aliases=aliases,
-                expiry_time=expiry_time,
-                data_classification=Classification(
-                    default=ClassificationInformation(level="CLASSIFICATION_LEVELS_UNCLASSIFIED")
-                ),
-                request_options=self._req_opts,
-            )
+            self._send(entity_id, kind, name, lat, lon, hae, stamps, now, iso_now)
         except Exception as e:
-            _log.warning("Lattice publish_system failed for %s: %s", entity_id, e)
+            return e
+        return None
 
-    # ───────────────────────────── Drone (air) ────────────────────────────────────
-    def publish_drone(self, d: Any) -> None:
+    def _send(self, entity_id: str, kind: str, name: str, lat: float, lon: float,
+              hae: Optional[float], stamps: Dict[Any, Any], now: dt.datetime, iso_now: str) -> None:
         """
-        Publish/refresh a drone entity (minimal). Accepts dict or object with attrs.
+        Publish one entity, retrying transient failures. Safe to repeat:
+        publishes are idempotent on entity_id.
         """
-        if not self._rate_ok("drone"):
+        attempt = 0
+        while True:
+            # Re-resolved per attempt: a raw publish may have switched us to the SDK
+            raw = self._raw_url is not None
+            stamp = stamps.get((kind, raw))
+            if stamp is None:
+                stamp = stamps[kind, raw] = self._stamp(kind, now, iso_now, raw)
+            try:
+                if raw:
+                    self._publish_raw(entity_id, kind, name, lat, lon, hae, stamp, now, iso_now)
+                else:
+                    self._publish_typed(entity_id, kind, name, lat, lon, hae, stamp)
+                return
+            except Exception as e:
+                attempt += 1
+                if attempt >= _RETRY_ATTEMPTS or self._stop.is_set() or not _is_transient(e):
+                    raise
+            time.sleep(min(_RETRY_BASE_DELAY * (2 ** attempt) + random.random() * _RETRY_BASE_DELAY,
+                           _RETRY_MAX_DELAY))
+
+    def _requeue(self, items) -> None:
+        """Put unsent entities back, without overwriting newer queued state."""
+        with self._pending_lock:
+            pending = self._pending
+            for entity_id, entry in items:
+                if entity_id not in pending and len(pending) < _MAX_PENDING:
+                    pending[entity_id] = entry
+
+    def _stamp(self, kind: str, now: dt.datetime, iso_now: str, raw: bool):
+        """(provenance, expiry) for one kind, as SDK models or REST JSON."""
+        data_type = _KIND_META[kind][0]
+        ttl = self._policies[kind].expiry
+        if raw:
+            return iso_now.encode(), (now + ttl).isoformat().encode()
+        return (
+            _make_provenance(
+                data_type=data_type,
+                integration_name=self.source_name,
+                source_update_time=now,
+            ),
+            now + ttl,
+        )
+
+    def _publish_typed(self, entity_id: str, kind: str, name: str, lat: float, lon: float,
+                       hae: Optional[float], stamp) -> None:
+        self.client.entities.publish_entity(
+            **self._builders[kind](entity_id, name, lat, lon, hae, stamp)
+        )
+
+    def _publish_raw(self, entity_id: str, kind: str, name: str, lat: float, lon: float,
+                     hae: Optional[float], stamp, now: dt.datetime, iso_now: str) -> None:
+        height = b""
+        if hae is not None:
+            height = b',"heightAboveEllipsoidMeters":%r' % hae
+
+        # Drones are aliased by their id: encode the string only once
+        quoted_id = _dumps(entity_id)
+        body = self._raw_templates[kind] % (
+            quoted_id,
+            lat,
+            lon,
+            height,
+            stamp[0],
+            quoted_id if name == entity_id else _dumps(name),
+            stamp[1],
+        )
+        if self._raw_gzip and len(body) >= _GZIP_MIN_BYTES:
+            resp = self._http.put(self._raw_url, content=gzip.compress(body, compresslevel=1, mtime=0),
+                                  headers=self._raw_headers_gz)
+            if resp.status_code in _RAW_SCHEMA_ERRORS:
+                # Try plain JSON before concluding the payload shape is wrong
+                _log.warning("Lattice rejected gzip request body (HTTP %d); sending uncompressed.",
+                             resp.status_code)
+                self._raw_gzip = False
+                resp = self._http.put(self._raw_url, content=body, headers=self._raw_headers)
+        else:
+            resp = self._http.put(self._raw_url, content=body, headers=self._raw_headers)
+        if resp.status_code in _RAW_SCHEMA_ERRORS:
+            _log.warning("Lattice rejected raw publish (HTTP %d); switching to SDK publish path.",
+                         resp.status_code)
+            self._raw_url = None
+            self._publish_typed(entity_id, kind, name, lat, lon, hae,
+                                self._stamp(kind, now, iso_now, False))
             return
+        resp.raise_for_status()
 
-        def g(key, default=None):
-            if isinstance(d, dict):
-                return d.get(key, default)
-            return getattr(d, key, default)
+    def stats(self) -> Dict[str, int]:
+        """Publish counters since start, plus the current queue depth."""
+        with self._pending_lock:
+            queued, dropped = len(self._pending), self._dropped
+        return {
+            "queued": queued,
+            "published": self._published,
+            "failed": self._failed,
+            "dropped": dropped,
+        }
+
+    def _finish(self) -> None:
+        """
+        Final flush, then release the worker pool and HTTP connections.
+        Runs on the flush thread (or after it has exited), so nothing tears
+        down the executor or client while a publish is still using them.
+        """
+        self.flush()
+        self._executor.shutdown(wait=True)
+        if self._http is not None:
+            try:
+                self._http.close()
+            except Exception:
+                pass
+        _log.info("Lattice sink closed: %s", self.stats())
 
-        entity_id = str(g("id", "unknown")) or "unknown"
-        lat = g("lat")
-        lon = g("lon")
-        hae = g("alt")
-        if not _valid_latlon(lat, lon):
+    def close(self) -> None:
+        """Stop the flush thread and publish anything still pending."""
+        global _open_sinks
+        if self._stop.is_set():
             return
+        with _open_sinks_lock:
+            _open_sinks -= 1
+        self._stop.set()
+        self._wake.set()
+        # The flush thread does the final flush itself; flushing from here
+        # as well would race it on the flush-only state mid-send.
+        if self._flush_thread.is_alive():
+            self._flush_thread.join(timeout=2.0)
+            if self._flush_thread.is_alive():
+                _log.warning("Lattice flush thread still publishing; final flush and "
+                             "teardown left to it")
+        else:
+            self._finish()
 
-        location = Location(position=Position(latitude_degrees=float(lat), longitude_degrees=float(lon)))
-        try:
-            if hae is not None:
-                location.position.height_above_ellipsoid_meters = float(hae)  # type: ignore[attr-defined]
-        except Exception:
-            pass
+    def __enter__(self) -> "LatticeSink":
+        return self
 
-        aliases = Aliases(name=entity_id)
-        ontology = Ontology(template="TEMPLATE_TRACK", platform_type="Small UAS")
+    def __exit__(self, *exc) -> None:
+        self.close()
 
-        mil_view = MilView(
-            environment=_air_env_value(),
-            disposition="DISPOSITION_NEUTRAL",
-        )
+    # ───────────────────────────── WarDragon (ground) ─────────────────────────────
+    def publish_system(self, s: Dict[str, Any]) -> None:
+        """
+        Publish WarDragon position as a minimal ground track.
+        """
+        # A missing/None/empty serial all map to "unknown" (not "None")
+        serial = str(s.get("serial_number") or "unknown")
+        if not self._rate_ok("system", serial):
+            return
 
-        provenance = Provenance(
-            data_type="drone-telemetry",
-            integration_name=self.source_name,
-            source_update_time=_now_utc().isoformat(),
-        )
-        expiry_time = _now_utc() + dt.timedelta(minutes=5)
+        gps = s.get("gps_data") or _EMPTY
+        latlon = _latlon(gps.get("latitude"), gps.get("longitude"))
+        if latlon is None:
+            return
 
-        try:
-            self.client.entities.publish_entity(
-                entity_id=entity_id,
-                is_live=True,
-                location=location,
-                ontology=ontology,
-                mil_view=mil_view,
-                provenance=provenance,
-                aliases=aliases,
-                expiry_time=expiry_time,
-                data_classification=Classification(
-                    default=ClassificationInformation(level="CLASSIFICATION_LEVELS_UNCLASSIFIED")
-                ),
-                request_options=self._req_opts,
-            )
-        except Exception as e:
-            _log.warning("Lattice publish_drone failed for %s: %s", entity_id, e)
+        entity_id, alias_name = _system_ids(serial)
+        self._enqueue("system", entity_id, alias_name, *latlon, gps.get("altitude"))
+
+    # ───────────────────────────── Drone (air) ────────────────────────────────────
+    def publish_drone(self, d: Any) -> None:
+        """
+        Publish/refresh a drone entity (minimal). Accepts dict or object with attrs;
+        lat/lon may be numbers or numeric strings, as for the other kinds.
+        """
+        # Dispatch on dict-vs-object once and read the fields directly
+        if isinstance(d, dict):
+            entity_id, lat, lon, hae = d.get("id", "unknown"), d.get("lat"), d.get("lon"), d.get("alt")
+        else:
+            entity_id = getattr(d, "id", "unknown")
+            lat = getattr(d, "lat", None)
+            lon = getattr(d, "lon", None)
+            hae = getattr(d, "alt", None)
+
+        entity_id = str(entity_id) or "unknown"
+        if not self._rate_ok("drone", entity_id):
+            return
+        # Inlined range check for numeric input: this is the per-drone hot path
+        if not (
+            isinstance(lat, (int, float)) and isinstance(lon, (int, float))
+            and -90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0
+        ):
+            # Anything else (e.g. numeric strings from dicts) takes the shared helper
+            latlon = _latlon(lat, lon)
+            if latlon is None:
+                return
+            lat, lon = latlon
+
+        self._enqueue("drone", entity_id, entity_id, lat, lon, hae)
 
     # ───────────────────────────── Pilot (ground) ─────────────────────────────────
     def publish_pilot(self, entity_base_id: str, lat: float, lon: float, *args, **kwargs) -> None:
@@ -293,63 +1001,7 @@ class LatticeSink:
             publish_pilot(id, lat, lon, display_name="Pilot X")
             publish_pilot(id, lat, lon, altitude=123.4)   # or hae=123.4
         """
-        if not self._rate_ok("pilot"):
-            return
-        if not _valid_latlon(lat, lon):
-            return
-
-        display_name = kwargs.get("display_name") or kwargs.get("name")
-        hae = kwargs.get("altitude", kwargs.get("hae"))
-
-        if args:
-            extra = args[0]
-            if isinstance(extra, str) and not display_name:
-                display_name = extra
-            else:
-                try:
-                    if hae is None:
-                        hae = float(extra)
-                except Exception:
-                    pass
-
-        entity_id = f"{entity_base_id}-pilot"
-        if not display_name:
-            display_name = f"Pilot of {entity_base_id}"
-
-        location = Location(position=Position(latitude_degrees=float(lat), longitude_degrees=float(lon)))
-        try:
-            if hae is not None:
-                location.position.height_above_ellipsoid_meters = float(hae)  # type: ignore
-        except Exception:
-            pass
-
-        ontology = Ontology(template="TEMPLATE_TRACK", platform_type="Operator")
-        mil_view = MilView()  # omit env & disposition for max compatibility
-
-        provenance = Provenance(
-            data_type="pilot-position",
-            integration_name=self.source_name,
-            source_update_time=_now_utc().isoformat(),
-        )
-        expiry_time = _now_utc() + dt.timedelta(minutes=30)
-
-        try:
-            self.client.entities.publish_entity(
-                entity_id=entity_id,
-                is_live=True,
-                location=location,
-                ontology=ontology,
-                mil_view=mil_view,
-                provenance=provenance,
-                aliases=Aliases(name=str(display_name)),
-                expiry_time=expiry_time,
-                data_classification=Classification(
-                    default=ClassificationInformation(level="CLASSIFICATION_LEVELS_UNCLASSIFIED")
-                ),
-                request_options=self._req_opts,
-            )
-        except Exception as e:
-            _log.warning("Lattice publish_pilot failed for %s: %s", entity_id, e)
+        self._publish_ground("pilot", entity_base_id, lat, lon, args, kwargs)
 
     # ───────────────────────────── Home (ground) ──────────────────────────────────
     def publish_home(self, entity_base_id: str, lat: float, lon: float, *args, **kwargs) -> None:
@@ -364,60 +1016,40 @@ class LatticeSink:
             publish_home(id, lat, lon, display_name="Home of X")
             publish_home(id, lat, lon, altitude=123.4)    # or hae=123.4
         """
-        if not self._rate_ok("home"):
+        self._publish_ground("home", entity_base_id, lat, lon, args, kwargs)
+
+    def _publish_ground(self, kind: str, entity_base_id: str, lat: Any, lon: Any,
+                        args: tuple, kwargs: Dict[str, Any]) -> None:
+        """Shared pilot/home publish path, parameterized by _GROUND_KINDS."""
+        if not self._rate_ok(kind, entity_base_id):
             return
-        if not _valid_latlon(lat, lon):
+        latlon = _latlon(lat, lon)
+        if latlon is None:
             return
+        lat, lon = latlon
 
-        display_name = kwargs.get("display_name") or kwargs.get("name")
-        hae = kwargs.get("altitude", kwargs.get("hae"))
+        # Common case (manager.py): publish_*(id, lat, lon, <float altitude>)
+        if kwargs:
+            display_name = kwargs.get("display_name") or kwargs.get("name")
+            hae = kwargs.get("altitude", kwargs.get("hae"))
+        else:
+            display_name = hae = None
 
         if args:
             extra = args[0]
-            if isinstance(extra, str) and not display_name:
+            if type(extra) is float:
+                if hae is None:
+                    hae = extra
+            elif isinstance(extra, str) and not display_name:
                 display_name = extra
-            else:
+            elif hae is None:
                 try:
-                    if hae is None:
-                        hae = float(extra)
-                except Exception:
+                    hae = float(extra)
+                except (TypeError, ValueError):
                     pass
 
-        entity_id = f"{entity_base_id}-home"
+        entity_id, default_name = _ground_ids(kind, str(entity_base_id))
         if not display_name:
-            display_name = f"Home of {entity_base_id}"
+            display_name = default_name
 
-        location = Location(position=Position(latitude_degrees=float(lat), longitude_degrees=float(lon)))
-        try:
-            if hae is not None:
-                location.position.height_above_ellipsoid_meters = float(hae)  # type: ignore
-        except Exception:
-            pass
-
-        ontology = Ontology(template="TEMPLATE_TRACK", platform_type="Home Point")
-        mil_view = MilView()  # omit env & disposition
-
-        provenance = Provenance(
-            data_type="home-position",
-            integration_name=self.source_name,
-            source_update_time=_now_utc().isoformat(),
-        )
-        expiry_time = _now_utc() + dt.timedelta(hours=4)
-
-        try:
-            self.client.entities.publish_entity(
-                entity_id=entity_id,
-                is_live=True,
-                location=location,
-                ontology=ontology,
-                mil_view=mil_view,
-                provenance=provenance,
-                aliases=Aliases(name=str(display_name)),
-                expiry_time=expiry_time,
-                data_classification=Classification(
-                    default=ClassificationInformation(level="CLASSIFICATION_LEVELS_UNCLASSIFIED")
-                ),
-                request_options=self._req_opts,
-            )
-        except Exception as e:
-            _log.warning("Lattice publish_home failed for %s: %s", entity_id, e)
+        self._enqueue(kind, entity_id, str(display_name), lat, lon, hae)
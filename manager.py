@@ -49,6 +49,9 @@ class DroneManager:
         self.drone_dict = {}
         self.rate_limit = rate_limit
         self.inactivity_timeout = inactivity_timeout
+        # Drone timestamps are monotonic nanoseconds; compare in integer ns
+        self._rate_limit_ns = int(rate_limit * 1e9)
+        self._inactivity_timeout_ns = int(inactivity_timeout * 1e9)
         self.cot_messenger = cot_messenger
         self.mqtt_enabled = mqtt_enabled
         self.mqtt_topic = mqtt_topic
@@ -76,7 +79,7 @@ class DroneManager:
                 logger.debug(f"Removed oldest drone: {oldest_drone_id}")
             self.drones.append(drone_id)
             self.drone_dict[drone_id] = drone_data
-            drone_data.last_sent_time = 0.0
+            drone_data.last_sent_time = 0
             logger.debug(f"Added new drone: {drone_id}")
         else:
             self.drone_dict[drone_id].update(
@@ -89,32 +92,33 @@ class DroneManager:
 
     def send_updates(self):
         """Sends regular CoT updates to the TAK server or multicast address."""
-        current_time = time.time()
+        current_time = time.monotonic_ns()
         drones_to_remove = []
 
         for drone_id in list(self.drones):
             drone = self.drone_dict[drone_id]
-            time_since_update = current_time - drone.last_update_time
+            ns_since_update = current_time - drone.last_update_time
 
-            if time_since_update > self.inactivity_timeout:
+            if ns_since_update > self._inactivity_timeout_ns:
                 drones_to_remove.append(drone_id)
-                logger.debug(f"Drone {drone_id} inactive for {time_since_update:.2f}s. Removing from tracking.")
+                logger.debug(f"Drone {drone_id} inactive for {ns_since_update / 1e9:.2f}s. Removing from tracking.")
                 continue
 
             delta_lat = drone.lat - drone.last_sent_lat
             delta_lon = drone.lon - drone.last_sent_lon
             position_change = math.sqrt(delta_lat ** 2 + delta_lon ** 2)
 
-            if current_time - drone.last_sent_time >= self.rate_limit:
+            if current_time - drone.last_sent_time >= self._rate_limit_ns:
+                stale_offset = (self._inactivity_timeout_ns - ns_since_update) / 1e9
                 cot_xml = drone.to_cot_xml(
-                    stale_offset=self.inactivity_timeout - time_since_update
+                    stale_offset=stale_offset
                 )
                 if self.cot_messenger:
                     self.cot_messenger.send_cot(cot_xml)
 
                 if self.mqtt_enabled and self.mqtt_client:
                     try:
-                        self.mqtt_client.publish(self.mqtt_topic, json.dumps(vars(drone)))
+                        self.mqtt_client.publish(self.mqtt_topic, json.dumps(drone.to_dict()))
                     except Exception as e:
                         logger.warning(f"Failed to publish to MQTT: {e}")
 
@@ -138,7 +142,7 @@ class DroneManager:
 
                 if drone.pilot_lat != 0.0 or drone.pilot_lon != 0.0:
                     pilot_xml = drone.to_pilot_cot_xml(
-                        stale_offset=self.inactivity_timeout - time_since_update
+                        stale_offset=stale_offset
                     )
                     if self.cot_messenger:
                         self.cot_messenger.send_cot(pilot_xml)
@@ -146,7 +150,7 @@ class DroneManager:
 
                 if drone.home_lat != 0.0 or drone.home_lon != 0.0:
                     home_xml = drone.to_home_cot_xml(
-                        stale_offset=self.inactivity_timeout - time_since_update
+                        stale_offset=stale_offset
                     )
                     if self.cot_messenger:
                         self.cot_messenger.send_cot(home_xml)